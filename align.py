@@ -0,0 +1,272 @@
+from bisect import bisect_left
+from collections import Counter
+from typing import List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# Upper bound on edit distance explored by the Myers fallback before a
+# segment is paired positionally instead.
+MAX_MYERS_EDITS = 2000
+
+
+class RowAlignment(NamedTuple):
+    left: np.ndarray      # row positions in file 1 of each aligned pair
+    right: np.ndarray     # row positions in file 2 of each aligned pair
+    changed: np.ndarray   # True where the aligned pair's row hashes differ
+    deleted: np.ndarray   # rows only present in file 1
+    inserted: np.ndarray  # rows only present in file 2
+
+
+def normalize_value(val):
+    """Normalize values for comparison: convert text numbers to numeric, keep strings as strings."""
+    if pd.isna(val):
+        return "<<NA>>"
+    # Try to convert to number if it's a string representation of a number
+    if isinstance(val, str):
+        val_stripped = val.strip()
+        if val_stripped == "":
+            return ""
+        # Try float first (handles both int and float strings)
+        try:
+            float_val = float(val_stripped)
+            # If it's a whole number, return as int for consistency
+            if float_val.is_integer():
+                return int(float_val)
+            return float_val
+        except (ValueError, AttributeError):
+            return val_stripped
+    # If already numeric, normalize floats that are whole numbers to ints
+    if isinstance(val, float) and val.is_integer():
+        return int(val)
+    return val
+
+
+def normalize_dataframe_for_comparison(df):
+    """Normalize all values in dataframe for comparison (text numbers -> numeric)."""
+    df_norm = df.copy()
+    for col in df_norm.columns:
+        # Keep object dtype so whole numbers stay ints instead of being re-inferred as float64
+        values = [normalize_value(v) for v in df_norm[col].tolist()]
+        df_norm[col] = pd.Series(values, index=df_norm.index, dtype=object)
+    return df_norm
+
+
+def row_hashes(df_norm: pd.DataFrame) -> np.ndarray:
+    """Hash each row of a normalized DataFrame into a uint64 fingerprint.
+
+    Cells are hashed by ``repr`` of their normalized Python value, so the
+    fingerprint doesn't depend on the column dtype and agrees with ``eq``.
+    """
+    return pd.util.hash_pandas_object(df_norm.map(repr), index=False).to_numpy()
+
+
+def _common_prefix(a: np.ndarray, b: np.ndarray) -> int:
+    n = min(len(a), len(b))
+    if n == 0:
+        return 0
+    neq = np.flatnonzero(a[:n] != b[:n])
+    return int(neq[0]) if len(neq) else n
+
+
+def _longest_increasing(pairs: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Longest chain of pairs increasing in the second coordinate (patience sort)."""
+    tails: List[int] = []
+    tail_idx: List[int] = []
+    prev: List[int] = [-1] * len(pairs)
+    for idx, (_, j) in enumerate(pairs):
+        pos = bisect_left(tails, j)
+        if pos == len(tails):
+            tails.append(j)
+            tail_idx.append(idx)
+        else:
+            tails[pos] = j
+            tail_idx[pos] = idx
+        prev[idx] = tail_idx[pos - 1] if pos > 0 else -1
+    chain = []
+    idx = tail_idx[-1] if tail_idx else -1
+    while idx != -1:
+        chain.append(pairs[idx])
+        idx = prev[idx]
+    chain.reverse()
+    return chain
+
+
+def _myers_matches(a: list, b: list, max_edits: int) -> Optional[List[Tuple[int, int]]]:
+    """Matched index pairs of a shortest edit script, or None if it exceeds max_edits."""
+    n, m = len(a), len(b)
+    v = {1: 0}
+    trace = []
+    for d in range(min(n + m, max_edits) + 1):
+        trace.append(v.copy())
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[k - 1] < v[k + 1]):
+                x = v[k + 1]
+            else:
+                x = v[k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[k] = x
+            if x >= n and y >= m:
+                return _myers_backtrack(trace, n, m)
+    return None
+
+
+def _myers_backtrack(trace: list, n: int, m: int) -> List[Tuple[int, int]]:
+    matches = []
+    x, y = n, m
+    for d in range(len(trace) - 1, -1, -1):
+        v = trace[d]
+        k = x - y
+        if k == -d or (k != d and v[k - 1] < v[k + 1]):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = v[prev_k]
+        prev_y = prev_x - prev_k
+        while x > prev_x and y > prev_y:
+            x -= 1
+            y -= 1
+            matches.append((x, y))
+        if d > 0:
+            x, y = prev_x, prev_y
+    matches.reverse()
+    return matches
+
+
+def _match_segment(a: list, b: list, a0: int, a1: int, b0: int, b1: int,
+                   max_edits: int) -> List[Tuple[int, int]]:
+    """Patience diff of a[a0:a1] vs b[b0:b1], falling back to Myers without unique anchors."""
+    matches: List[Tuple[int, int]] = []
+    stack = [(a0, a1, b0, b1)]
+    while stack:
+        a0, a1, b0, b1 = stack.pop()
+        # Strip the common prefix and suffix
+        while a0 < a1 and b0 < b1 and a[a0] == b[b0]:
+            matches.append((a0, b0))
+            a0 += 1
+            b0 += 1
+        while a0 < a1 and b0 < b1 and a[a1 - 1] == b[b1 - 1]:
+            a1 -= 1
+            b1 -= 1
+            matches.append((a1, b1))
+        if a0 == a1 or b0 == b1:
+            continue
+
+        # Anchor on rows that occur exactly once on each side
+        count_a = Counter(a[a0:a1])
+        count_b = Counter(b[b0:b1])
+        pos_b = {b[j]: j for j in range(b0, b1) if count_b[b[j]] == 1}
+        candidates = [(i, pos_b[a[i]]) for i in range(a0, a1)
+                      if count_a[a[i]] == 1 and a[i] in pos_b]
+        anchors = _longest_increasing(candidates)
+
+        if anchors:
+            matches.extend(anchors)
+            prev_i, prev_j = a0, b0
+            for i, j in anchors:
+                stack.append((prev_i, i, prev_j, j))
+                prev_i, prev_j = i + 1, j + 1
+            stack.append((prev_i, a1, prev_j, b1))
+            continue
+
+        found = _myers_matches(a[a0:a1], b[b0:b1], max_edits)
+        if found:
+            matches.extend((a0 + i, b0 + j) for i, j in found)
+    matches.sort()
+    return matches
+
+
+def align_rows(hashes1: np.ndarray, hashes2: np.ndarray,
+               max_edits: int = MAX_MYERS_EDITS) -> RowAlignment:
+    """Align two sequences of row hashes, detecting inserted, deleted and modified rows.
+
+    Identical rows are matched with a patience/Myers diff. Unmatched rows sitting
+    between the same pair of matches are paired positionally as modified rows (a
+    leading gap is paired from its end); any surplus on either side is reported
+    as deleted (file 1) or inserted (file 2).
+    """
+    n, m = len(hashes1), len(hashes2)
+
+    # Fast path: common prefix and suffix are matched without leaving numpy
+    prefix = _common_prefix(hashes1, hashes2)
+    suffix = _common_prefix(hashes1[prefix:][::-1], hashes2[prefix:][::-1])
+    a = hashes1[prefix:n - suffix].tolist()
+    b = hashes2[prefix:m - suffix].tolist()
+    middle = _match_segment(a, b, 0, len(a), 0, len(b), max_edits)
+
+    left: List[int] = []
+    right: List[int] = []
+    deleted: List[int] = []
+    inserted: List[int] = []
+
+    prev_i = prev_j = 0
+    for i, j in middle + [(len(a), len(b))]:
+        gap_a = i - prev_i
+        gap_b = j - prev_j
+        paired = min(gap_a, gap_b)
+        if prefix == 0 and prev_i == 0 and prev_j == 0:
+            # Leading gap: pair the rows adjacent to the first match, so surplus
+            # rows at the top of a file are reported as inserted/deleted
+            deleted.extend(range(i - paired))
+            inserted.extend(range(j - paired))
+            left.extend(range(i - paired, i))
+            right.extend(range(j - paired, j))
+        else:
+            left.extend(range(prefix + prev_i, prefix + prev_i + paired))
+            right.extend(range(prefix + prev_j, prefix + prev_j + paired))
+            deleted.extend(range(prefix + prev_i + paired, prefix + i))
+            inserted.extend(range(prefix + prev_j + paired, prefix + j))
+        if i < len(a):
+            left.append(prefix + i)
+            right.append(prefix + j)
+        prev_i, prev_j = i + 1, j + 1
+
+    left_arr = np.concatenate([np.arange(prefix), np.asarray(left, dtype=np.int64),
+                               np.arange(n - suffix, n)])
+    right_arr = np.concatenate([np.arange(prefix), np.asarray(right, dtype=np.int64),
+                                np.arange(m - suffix, m)])
+    left_arr = left_arr.astype(np.int64)
+    right_arr = right_arr.astype(np.int64)
+    # Positionally paired gap rows can still be identical (e.g. after the Myers
+    # cut-off), so compare the hashes rather than flagging every gap pair
+    return RowAlignment(
+        left=left_arr,
+        right=right_arr,
+        changed=hashes1[left_arr] != hashes2[right_arr],
+        deleted=np.asarray(deleted, dtype=np.int64),
+        inserted=np.asarray(inserted, dtype=np.int64),
+    )
+
+
+def diff_coordinates(alignment: RowAlignment, norm1: pd.DataFrame, norm2: pd.DataFrame,
+                     raw1: pd.DataFrame, raw2: pd.DataFrame) -> pd.DataFrame:
+    """Extract differing cells of the aligned modified pairs as a sparse coordinate list.
+
+    Returns one row per differing cell with columns ``row`` (aligned pair
+    position), ``row1`` and ``row2`` (row numbers in each file), ``column``,
+    ``file1`` and ``file2`` (original, un-normalized values). Only pairs whose
+    row hashes differ are compared, so the cost scales with the number of
+    modified rows rather than the file size.
+    """
+    pairs = np.flatnonzero(alignment.changed)
+    if len(pairs) == 0:
+        return pd.DataFrame({"row": pd.Series(dtype=np.int64), "row1": pd.Series(dtype=np.int64),
+                             "row2": pd.Series(dtype=np.int64), "column": pd.Series(dtype=object),
+                             "file1": pd.Series(dtype=object), "file2": pd.Series(dtype=object)})
+    left = alignment.left[pairs]
+    right = alignment.right[pairs]
+    left_norm = norm1.iloc[left].reset_index(drop=True)
+    right_norm = norm2.iloc[right].reset_index(drop=True)
+    rows, cols = np.nonzero(~left_norm.eq(right_norm).to_numpy())
+    return pd.DataFrame({
+        "row": pairs[rows],
+        "row1": left[rows],
+        "row2": right[rows],
+        "column": norm1.columns[cols],
+        "file1": raw1.iloc[left].to_numpy(dtype=object)[rows, cols],
+        "file2": raw2.iloc[right].to_numpy(dtype=object)[rows, cols],
+    })
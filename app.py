@@ -1,8 +1,12 @@
+import base64
+import textwrap
 import streamlit as st
 import pandas as pd
 from io import BytesIO
-import openpyxl
-from openpyxl.styles import PatternFill
+
+from align import align_rows, diff_coordinates, normalize_dataframe_for_comparison, row_hashes
+from estimate import estimate_divergence, read_csv_header, sample_csv_blocks, sample_frame_blocks
+from report import compact_report, diff_styles, highlight_excel_diffs, side_by_side
 
 
 st.set_page_config(
@@ -13,17 +17,17 @@ st.set_page_config(
 )
 
 # PWA Meta Tags
-st.markdown("""
+PWA_META_HTML = """
     <link rel="manifest" href="manifest.json">
     <meta name="theme-color" content="#667eea">
     <meta name="apple-mobile-web-app-capable" content="yes">
     <meta name="apple-mobile-web-app-status-bar-style" content="black-translucent">
     <meta name="apple-mobile-web-app-title" content="File Compare">
     <link rel="apple-touch-icon" href="logo.svg">
-""", unsafe_allow_html=True)
+"""
 
 # Custom CSS for better UI
-st.markdown("""
+CUSTOM_CSS = """
     <style>
     /* Hide Streamlit menu and header */
     #MainMenu {visibility: hidden;}
@@ -95,38 +99,46 @@ st.markdown("""
         box-shadow: 0 4px 8px rgba(0,0,0,0.2);
     }
     </style>
-""", unsafe_allow_html=True)
+"""
 
-# Logo and Header
-import base64
-try:
-    with open("logo.svg", "rb") as f:
-        logo_bytes = f.read()
-        logo_base64 = base64.b64encode(logo_bytes).decode()
-    st.markdown(f"""
-        <div class="header-container">
-            <div class="logo-container">
-                <img src="data:image/svg+xml;base64,{logo_base64}" alt="Logo" style="width: 32px; height: 32px;">
-            </div>
-            <div class="header-text">
-                <h1 class="main-header">File Compare Tool</h1>
-                <p class="sub-header">Compare CSV and Excel files side-by-side</p>
-            </div>
-        </div>
-    """, unsafe_allow_html=True)
-except Exception as e:
-    # Fallback to emoji if logo file not found
-    st.markdown("""
+
+@st.cache_resource(show_spinner=False)
+def load_logo_base64(path="logo.svg"):
+    """Read and base64-encode the logo once per process (None if unavailable)."""
+    try:
+        with open(path, "rb") as f:
+            return base64.b64encode(f.read()).decode()
+    except OSError:
+        return None
+
+
+@st.cache_resource(show_spinner=False)
+def build_page_chrome_html():
+    """Build the static head/CSS/header markup once per process."""
+    logo_base64 = load_logo_base64()
+    if logo_base64:
+        logo_html = f'<img src="data:image/svg+xml;base64,{logo_base64}" alt="Logo" style="width: 32px; height: 32px;">'
+    else:
+        # Fallback to emoji if logo file not found
+        logo_html = '<div style="font-size: 24px; margin: 0;">📊</div>'
+    header_html = f"""
         <div class="header-container">
             <div class="logo-container">
-                <div style="font-size: 24px; margin: 0;">📊</div>
+                {logo_html}
             </div>
             <div class="header-text">
                 <h1 class="main-header">File Compare Tool</h1>
                 <p class="sub-header">Compare CSV and Excel files side-by-side</p>
             </div>
         </div>
-    """, unsafe_allow_html=True)
+    """
+    # st.markdown dedents by the common indent of the whole string, so dedent each
+    # fragment first; otherwise the header stays indented and renders as a code block
+    return "\n".join(textwrap.dedent(part) for part in (PWA_META_HTML, CUSTOM_CSS, header_html))
+
+
+# Logo and Header (emitted as a single element to keep reruns cheap)
+st.markdown(build_page_chrome_html(), unsafe_allow_html=True)
 
 st.markdown("---")
 
@@ -168,6 +180,11 @@ with col4:
         value=True,
         help="When enabled, only rows with differences will be displayed"
     )
+    quick_estimate = st.checkbox(
+        "Quick estimate only (sampled)",
+        value=False,
+        help="Sample blocks of rows to estimate how different the files are before running a full compare"
+    )
 
 st.markdown("---")
 
@@ -185,18 +202,14 @@ def detect_file_type(filename_or_path):
     return None
 
 
-def load_from_uploader(uploaded, enc_list):
-    """Load file from uploader, supporting both CSV and Excel."""
-    if uploaded is None:
-        raise ValueError("Please upload a file")
-    
-    # Detect file type from uploaded file name
-    file_type = detect_file_type(uploaded.name)
-    
+@st.cache_data(show_spinner=False, max_entries=4)
+def read_file_bytes(data, filename, enc_list):
+    """Parse uploaded file bytes into a DataFrame; cached so reruns skip re-parsing."""
+    file_type = detect_file_type(filename)
+
     if file_type == 'excel':
         try:
-            uploaded.seek(0)
-            df = pd.read_excel(uploaded, engine='openpyxl')
+            df = pd.read_excel(BytesIO(data), engine='openpyxl')
             return df, 'excel'
         except Exception as e:
             raise Exception(f"Failed to load Excel file: {e}")
@@ -205,52 +218,85 @@ def load_from_uploader(uploaded, enc_list):
         last_exc = None
         for enc in enc_list:
             try:
-                uploaded.seek(0)
-                df = pd.read_csv(uploaded, encoding=enc)
+                df = pd.read_csv(BytesIO(data), encoding=enc)
                 return df, enc
             except Exception as e:
                 last_exc = e
         raise last_exc or Exception("Failed to load CSV file with any encoding")
 
 
-def normalize_value(val):
-    """Normalize values for comparison: convert text numbers to numeric, keep strings as strings."""
-    if pd.isna(val):
-        return "<<NA>>"
-    # Try to convert to number if it's a string representation of a number
-    if isinstance(val, str):
-        val_stripped = val.strip()
-        if val_stripped == "":
-            return ""
-        # Try float first (handles both int and float strings)
+def load_from_uploader(uploaded, enc_list):
+    """Load file from uploader, supporting both CSV and Excel."""
+    if uploaded is None:
+        raise ValueError("Please upload a file")
+
+    return read_file_bytes(uploaded.getvalue(), uploaded.name, tuple(enc_list))
+
+
+def upload_columns(uploaded, enc_list):
+    """Column names of an upload, reading only the header line for CSVs."""
+    if detect_file_type(uploaded.name) == 'csv':
+        return read_csv_header(uploaded, enc_list)
+    df, _ = load_from_uploader(uploaded, enc_list)
+    return df.columns
+
+
+def sample_uploads(uploaded1, uploaded2, enc_list, columns):
+    """Block-sample both uploads, seeking within CSVs instead of parsing them in full."""
+    if detect_file_type(uploaded1.name) == 'csv' and detect_file_type(uploaded2.name) == 'csv':
+        return sample_csv_blocks(uploaded1, uploaded2, enc_list, columns)
+    df1, _ = load_from_uploader(uploaded1, enc_list)
+    df2, _ = load_from_uploader(uploaded2, enc_list)
+    return sample_frame_blocks(df1, df2, columns)
+
+
+def request_full_compare():
+    st.session_state["run_full_compare"] = True
+
+
+run_full_compare = st.session_state.pop("run_full_compare", False)
+
+if (compare_button or run_full_compare) and (uploaded1 is None or uploaded2 is None):
+    st.error("⚠️ Please upload both files to compare")
+    st.stop()
+
+encodings = [encoding] if encoding != "Auto" else ["utf-8", "cp1252", "latin1"]
+
+if compare_button and quick_estimate:
+    with st.spinner("Sampling files..."):
         try:
-            float_val = float(val_stripped)
-            # If it's a whole number, return as int for consistency
-            if float_val.is_integer():
-                return int(float_val)
-            return float_val
-        except (ValueError, AttributeError):
-            return val_stripped
-    # If already numeric, normalize floats that are whole numbers to ints
-    if isinstance(val, float) and val.is_integer():
-        return int(val)
-    return val
-
-
-def normalize_dataframe_for_comparison(df):
-    """Normalize all values in dataframe for comparison (text numbers -> numeric)."""
-    df_norm = df.copy()
-    for col in df_norm.columns:
-        df_norm[col] = df_norm[col].apply(normalize_value)
-    return df_norm
-
-
-if compare_button:
-    if uploaded1 is None or uploaded2 is None:
-        st.error("⚠️ Please upload both files to compare")
-        st.stop()
-    
-    encodings = [encoding] if encoding != "Auto" else ["utf-8", "cp1252", "latin1"]
+            columns1 = upload_columns(uploaded1, encodings)
+            columns2 = upload_columns(uploaded2, encodings)
+            common_cols = columns1.intersection(columns2)
+            if len(common_cols) == 0:
+                st.warning("No common columns between the files — can't estimate a meaningful cell-by-cell difference.")
+                st.write("File 1 columns:", list(columns1))
+                st.write("File 2 columns:", list(columns2))
+                st.stop()
+            est = estimate_divergence(sample_uploads(uploaded1, uploaded2, encodings, common_cols), common_cols)
+        except Exception as e:
+            st.error(f"❌ Could not estimate differences: {e}")
+            st.stop()
+
+    st.markdown("---")
+    st.markdown("## ⚡ Quick Estimate")
+    st.caption(f"Based on {est.rows_sampled} sampled rows from {est.blocks} blocks of File 1. "
+               "Ranges are 95% confidence bounds.")
+    if est.unaligned_blocks:
+        st.warning(f"{est.unaligned_blocks} of {est.blocks} sampled blocks had no matching rows anywhere near their "
+                   "position in File 2, so they were compared by position only.")
+    col_est1, col_est2 = st.columns(2)
+    with col_est1:
+        st.metric("Estimated Mismatched Rows", f"{est.mismatch_rate:.1%}")
+    with col_est2:
+        st.metric("95% Range", f"{est.mismatch_low:.1%} – {est.mismatch_high:.1%}")
+    if not est.column_rates.empty:
+        st.markdown("**Per-column change rates**")
+        st.dataframe(est.column_rates.rename(columns={"change_rate": "Change rate", "low": "Low", "high": "High"})
+                     .style.format("{:.2%}"), use_container_width=True)
+    st.button("🔍 Run Full Exact Compare", on_click=request_full_compare, use_container_width=True)
+
+if (compare_button and not quick_estimate) or run_full_compare:
 
     with st.spinner("Loading files..."):
         try:
@@ -288,41 +334,52 @@ if compare_button:
     df1c = df1c.reset_index(drop=True)
     df2c = df2c.reset_index(drop=True)
 
-    # Truncate to the smaller number of rows to allow pairwise comparison
-    min_rows = min(len(df1c), len(df2c))
-    if len(df1c) != len(df2c):
-        st.info(f"Files have different number of rows ({len(df1c)} vs {len(df2c)}). Comparing first {min_rows} rows.")
-    df1c = df1c.iloc[:min_rows]
-    df2c = df2c.iloc[:min_rows]
-
     # Normalize dataframes for comparison (text numbers -> numeric)
     df1c_norm = normalize_dataframe_for_comparison(df1c)
     df2c_norm = normalize_dataframe_for_comparison(df2c)
 
-    # Create mask of differences (treat NaN == NaN, text numbers == numeric)
-    mask = ~(df1c_norm.eq(df2c_norm))
-    differing_rows_mask = mask.any(axis=1)
+    # Align rows by content so inserted/deleted rows don't shift every following row
+    alignment = align_rows(row_hashes(df1c_norm), row_hashes(df2c_norm))
+    deleted_rows = df1c.iloc[alignment.deleted]
+    inserted_rows = df2c.iloc[alignment.inserted]
+    if len(deleted_rows) or len(inserted_rows):
+        st.info(f"Files have {len(df1c)} vs {len(df2c)} rows. Aligned {len(alignment.left)} row pairs; "
+                f"{len(deleted_rows)} row(s) only in File 1, {len(inserted_rows)} row(s) only in File 2.")
+
+    df1_aligned = df1c.iloc[alignment.left].reset_index(drop=True)
+    df2_aligned = df2c.iloc[alignment.right].reset_index(drop=True)
+    min_rows = len(df1_aligned)
+
+    # Extract differing cells once as a sparse (row, column, old, new) list
+    # (treat NaN == NaN, text numbers == numeric). Only aligned pairs whose row
+    # hashes differ need a cell-level comparison.
+    diffs = diff_coordinates(alignment, df1c_norm, df2c_norm, df1c, df2c)
+    column_diff_counts = diffs["column"].value_counts().reindex(common_cols, fill_value=0)
+    differing_rows_mask = pd.Series(False, index=df1_aligned.index)
+    differing_rows_mask.iloc[diffs["row"].unique()] = True
 
     # Prepare filtered DataFrames if user wants only differing rows
     if show_only_diff:
         if not differing_rows_mask.any():
             st.info("No differing rows found in the compared range.")
-        df1_display = df1c[differing_rows_mask].copy()
-        df2_display = df2c[differing_rows_mask].copy()
+        df1_rows = df1_aligned[differing_rows_mask]
+        df2_rows = df2_aligned[differing_rows_mask]
     else:
-        df1_display = df1c.copy()
-        df2_display = df2c.copy()
+        df1_rows = df1_aligned
+        df2_rows = df2_aligned
+
+    # Label displayed rows with each file's own row numbers
+    df1_display = df1_rows.set_axis(alignment.left[df1_rows.index])
+    df2_display = df2_rows.set_axis(alignment.right[df2_rows.index])
 
     # --- Order-agnostic (multiset) comparison ---
     # Build hashable row keys from common columns (normalized: text numbers -> numeric, NaNs normalized)
-    def rows_to_tuples(df: pd.DataFrame) -> pd.Series:
-        # Use normalized dataframe for comparison
-        df_norm = normalize_dataframe_for_comparison(df)
+    def rows_to_tuples(df_norm: pd.DataFrame) -> pd.Series:
         # Convert to string representation for hashing (normalized values)
         return df_norm.astype(str).apply(lambda r: tuple(r.values.tolist()), axis=1)
 
-    a_rows = rows_to_tuples(df1c)
-    b_rows = rows_to_tuples(df2c)
+    a_rows = rows_to_tuples(df1c_norm)
+    b_rows = rows_to_tuples(df2c_norm)
 
     from collections import Counter
     ca = Counter(a_rows)
@@ -343,6 +400,10 @@ if compare_button:
     with col_metric3:
         st.metric("Rows Mismatched (Order-agnostic)", unordered_mismatch_count)
 
+    if column_diff_counts.any():
+        st.markdown("**Differing cells per column**")
+        st.dataframe(column_diff_counts[column_diff_counts > 0].rename("Differing Cells").to_frame(), use_container_width=True)
+
     # Prepare DataFrames of unmatched rows (with repetitions equal to the difference in counts)
     def expand_counter_to_df(counter_source: Counter, counter_other: Counter, columns: pd.Index) -> pd.DataFrame:
         rows = []
@@ -376,92 +437,68 @@ if compare_button:
                 csv2 = unmatched_in_file2.to_csv(index=False).encode("utf-8")
                 st.download_button("📥 Download File 2 Unmatched", data=csv2, file_name="unmatched_file2.csv", mime="text/csv", use_container_width=True)
 
+    if len(deleted_rows) or len(inserted_rows):
+        st.markdown("---")
+        st.markdown("### ➕ Inserted / Deleted Rows")
+        c1, c2 = st.columns(2)
+        with c1:
+            st.markdown(f"**Only in File 1** - {len(deleted_rows)} rows")
+            st.dataframe(deleted_rows, use_container_width=True)
+        with c2:
+            st.markdown(f"**Only in File 2** - {len(inserted_rows)} rows")
+            st.dataframe(inserted_rows, use_container_width=True)
+
     # Show side-by-side with highlights
     st.markdown("---")
     st.markdown("### 🔄 Side-by-Side Comparison")
     st.markdown("*Differences are highlighted in red*")
     left, right = st.columns(2)
 
-    def highlight_cols(col):
-        return ["background-color: #ffcccc" if mask.at[idx, col.name] else "" for idx in col.index]
-
     with left:
         st.markdown(f"**📄 {uploaded1.name}**")
         try:
-            st.dataframe(df1_display.style.apply(highlight_cols, axis=0), height=600, use_container_width=True)
+            st.dataframe(df1_display.style.apply(diff_styles, diffs=diffs, row_col="row1", axis=None), height=600, use_container_width=True)
         except Exception:
             st.dataframe(df1_display, height=600, use_container_width=True)
 
     with right:
         st.markdown(f"**📄 {uploaded2.name}**")
         try:
-            st.dataframe(df2_display.style.apply(highlight_cols, axis=0), height=600, use_container_width=True)
+            st.dataframe(df2_display.style.apply(diff_styles, diffs=diffs, row_col="row2", axis=None), height=600, use_container_width=True)
         except Exception:
             st.dataframe(df2_display, height=600, use_container_width=True)
 
-    # Show compact diff summary using pandas.compare
+    # Compact diff summary pivoted from the sparse coordinate list (self/other per column)
     st.markdown("---")
     st.markdown("### 📋 Compact Difference Report")
     try:
-        # Compare on the displayed (possibly filtered) rows
-        dfcomp = df1_display.compare(df2_display)
+        dfcomp = compact_report(diffs, common_cols)
         if dfcomp.empty:
             st.success("✅ No differences found in compared rows/columns.")
         else:
             st.dataframe(dfcomp, use_container_width=True)
-            # Allow download of the compact diff
+            # Allow download of the compact diff and of the raw cell list
             csv_bytes = dfcomp.to_csv(index=True).encode("utf-8")
             st.download_button("📥 Download Diff CSV", data=csv_bytes, file_name="diff.csv", mime="text/csv", use_container_width=True)
+            cells = diffs.drop(columns="row").rename(columns={"row1": "row_file1", "row2": "row_file2"})
+            cells_csv = cells.to_csv(index=False).encode("utf-8")
+            st.download_button("📥 Download Cell Differences CSV", data=cells_csv, file_name="diff_cells.csv", mime="text/csv", use_container_width=True)
 
         # Also provide a combined CSV of differing rows with side-by-side values if the user chose only differing rows
         if show_only_diff and differing_rows_mask.any():
-            combined = []
-            for col in common_cols:
-                combined.append(df1_display[col].rename(f"{col}_file1"))
-                combined.append(df2_display[col].rename(f"{col}_file2"))
-            combined_df = pd.concat(combined, axis=1)
-            csv_bytes2 = combined_df.to_csv(index=True).encode("utf-8")
+            combined_df = side_by_side(df1_rows, df2_rows, common_cols, alignment)
+            csv_bytes2 = combined_df.to_csv(index=False).encode("utf-8")
             st.download_button("📥 Download Side-by-Side CSV", data=csv_bytes2, file_name="differing_rows_side_by_side.csv", mime="text/csv", use_container_width=True)
 
             # Also offer an Excel download with differing cells highlighted in red
             try:
                 excel_out = BytesIO()
                 with pd.ExcelWriter(excel_out, engine="openpyxl") as writer:
-                    combined_df.to_excel(writer, index=True, sheet_name="side_by_side")
+                    combined_df.to_excel(writer, index=False, sheet_name="side_by_side")
                 excel_out.seek(0)
-                wb = openpyxl.load_workbook(excel_out)
-                ws = wb["side_by_side"]
-                red = PatternFill(start_color="FFFFC7CE", end_color="FFFFC7CE", fill_type="solid")
-
-                # Determine differing cells: columns are ordered as in combined_df
-                # We'll compare file1/file2 pairs by column name suffix
-                col_names = combined_df.columns.tolist()
-                # find pairs like '<col>_file1' and '<col>_file2'
-                pairs = []
-                i = 0
-                while i < len(col_names) - 1:
-                    left = col_names[i]
-                    right = col_names[i + 1]
-                    if left.endswith("_file1") and right.endswith("_file2") and left[:-6] == right[:-6]:
-                        pairs.append((i + 2, i + 3))  # +2 because openpyxl is 1-based and first column is index
-                        i += 2
-                    else:
-                        i += 1
-
-                # Apply red fill where values differ
-                for (c1, c2) in pairs:
-                    for r in range(2, ws.max_row + 1):
-                        v1 = ws.cell(row=r, column=c1).value
-                        v2 = ws.cell(row=r, column=c2).value
-                        if (v1 is None and v2 is None) or (v1 == v2):
-                            continue
-                        ws.cell(row=r, column=c1).fill = red
-                        ws.cell(row=r, column=c2).fill = red
-
-                out2 = BytesIO()
-                wb.save(out2)
-                out2.seek(0)
-                st.download_button("📥 Download Excel (Highlighted)", data=out2.getvalue(), file_name="differing_rows_side_by_side.xlsx", mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", use_container_width=True)
+                # Column 3 holds the first '<col>_file1' value (columns 1-2 are the row numbers)
+                excel_bytes = highlight_excel_diffs(excel_out, "side_by_side", diffs, combined_df.index, common_cols, first_col=3)
+                st.download_button("📥 Download Excel (Highlighted)", data=excel_bytes, file_name="differing_rows_side_by_side.xlsx", mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", use_container_width=True)
             except Exception as e:
                 st.warning(f"Could not create Excel download: {e}")
 
@@ -473,53 +510,19 @@ if compare_button:
                 with pd.ExcelWriter(out, engine="openpyxl") as writer:
                     # Write side-by-side if differing rows exist
                     if show_only_diff and differing_rows_mask.any():
-                        combined_df.to_excel(writer, sheet_name="side_by_side", index=False)
+                        side_by_side_df = combined_df
                     else:
                         # If not filtering, write a side-by-side snapshot of compared rows
-                        combined_all = []
-                        for col in common_cols:
-                            combined_all.append(df1c[col].rename(f"{col}_file1"))
-                            combined_all.append(df2c[col].rename(f"{col}_file2"))
-                        combined_all_df = pd.concat(combined_all, axis=1)
-                        combined_all_df.to_excel(writer, sheet_name="side_by_side", index=False)
+                        side_by_side_df = side_by_side(df1_aligned, df2_aligned, common_cols, alignment)
+                    side_by_side_df.to_excel(writer, sheet_name="side_by_side", index=False)
 
                     # Write compact diff (may be empty)
-                    try:
-                        comp_sheet = dfcomp if 'dfcomp' in locals() else df1c.compare(df2c)
-                        comp_sheet.to_excel(writer, sheet_name="compact_diff")
-                    except Exception:
-                        # If compare fails, write a note
-                        pd.DataFrame({"note": ["Could not compute compact diff"]}).to_excel(writer, sheet_name="compact_diff", index=False)
+                    dfcomp.to_excel(writer, sheet_name="compact_diff")
 
                 # Apply highlighting to side_by_side sheet (reopen workbook in memory)
                 out.seek(0)
-                wb = openpyxl.load_workbook(out)
-                if "side_by_side" in wb.sheetnames:
-                    ws = wb["side_by_side"]
-                    red = PatternFill(start_color="FFFFC7CE", end_color="FFFFC7CE", fill_type="solid")
-
-                    # Identify column pairs: columns are named like '<col>_file1', '<col>_file2'
-                    max_col = ws.max_column
-                    # Compare pairs (1-based column indices)
-                    col = 1
-                    while col < max_col:
-                        for row in range(2, ws.max_row + 1):
-                            cell1 = ws.cell(row=row, column=col)
-                            cell2 = ws.cell(row=row, column=col + 1)
-                            v1 = cell1.value
-                            v2 = cell2.value
-                            if (v1 is None and v2 is None) or (v1 == v2):
-                                continue
-                            # mark both cells
-                            cell1.fill = red
-                            cell2.fill = red
-                        col += 2
-
-                # Save workbook back to bytes
-                out2 = BytesIO()
-                wb.save(out2)
-                out2.seek(0)
-                st.download_button("📥 Download Excel Report", data=out2.getvalue(), file_name="diff_report.xlsx", mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", use_container_width=True)
+                report_bytes = highlight_excel_diffs(out, "side_by_side", diffs, side_by_side_df.index, common_cols, first_col=3)
+                st.download_button("📥 Download Excel Report", data=report_bytes, file_name="diff_report.xlsx", mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", use_container_width=True)
     except Exception as e:
         st.error(f"❌ Could not compute compact diff: {e}")
 
@@ -528,6 +531,6 @@ if compare_button:
     st.info("""
     - **File Formats**: Supports CSV and Excel (.xlsx, .xls) files
     - **Text vs Numbers**: The tool automatically treats text numbers (e.g., "123") as equal to numeric values (123)
-    - **Large Files**: For very large files, consider filtering to specific columns or rows before comparison
+    - **Large Files**: For very large files, use "Quick estimate only" first, or filter to specific columns or rows before comparison
     - **Encoding**: If CSV files fail to load, try different encoding options
     """)
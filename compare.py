@@ -4,6 +4,8 @@ import argparse
 import pandas as pd
 from typing import Optional, List
 
+from estimate import DEFAULT_BLOCK_ROWS, DEFAULT_BLOCKS, estimate_divergence, read_csv_header, sample_csv_blocks
+
 
 def load_csv_with_encodings(path_str: str, encodings: List[str]) -> tuple[pd.DataFrame, Optional[str]]:
     p = Path(path_str).expanduser()
@@ -38,12 +40,51 @@ def compare_dataframes(df1: pd.DataFrame, df2: pd.DataFrame):
         print("Could not compute cell-wise differences:", e)
 
 
+def print_estimate(path1: str, path2: str, encodings: List[str], blocks: int, block_rows: int):
+    p1 = Path(path1).expanduser()
+    p2 = Path(path2).expanduser()
+    for p in (p1, p2):
+        if not p.exists():
+            raise FileNotFoundError(f"File not found: {p}")
+
+    with open(p1, "rb") as f1, open(p2, "rb") as f2:
+        columns1 = read_csv_header(f1, encodings)
+        columns2 = read_csv_header(f2, encodings)
+        common_cols = columns1.intersection(columns2)
+        if len(common_cols) == 0:
+            print("No common columns between the files — can't estimate a meaningful cell-by-cell difference.")
+            print("File 1 columns:", list(columns1))
+            print("File 2 columns:", list(columns2))
+            return
+        est = estimate_divergence(sample_csv_blocks(f1, f2, encodings, common_cols, blocks, block_rows), common_cols)
+
+    print(f"Quick estimate from {est.rows_sampled} sampled rows in {est.blocks} blocks:")
+    if est.unaligned_blocks:
+        print(f"  {est.unaligned_blocks} of {est.blocks} blocks had no matching rows near their position in "
+              "the second file and were compared by position only.")
+    print(f"  Mismatched rows: ~{est.mismatch_rate:.2%} "
+          f"(95% CI {est.mismatch_low:.2%} - {est.mismatch_high:.2%})")
+    if not est.column_rates.empty:
+        print("  Per-column change rates:")
+        for col, row in est.column_rates.iterrows():
+            print(f"    {col}: ~{row['change_rate']:.2%} ({row['low']:.2%} - {row['high']:.2%})")
+
+
 def parse_args():
     p = argparse.ArgumentParser(description="Compare two CSV files and show differences.")
     p.add_argument("file1", nargs="?", help="Path to first CSV file")
     p.add_argument("file2", nargs="?", help="Path to second CSV file")
     p.add_argument("--encoding", "-e", help="Encoding to use for both files (if not set, tries utf-8, cp1252, latin1)")
-    return p.parse_args()
+    p.add_argument("--estimate", action="store_true", help="Sample blocks of rows and estimate how different the files are instead of comparing them in full")
+    p.add_argument("--escalate", action="store_true", help="With --estimate, run the full exact compare after printing the estimate")
+    p.add_argument("--blocks", type=int, default=DEFAULT_BLOCKS, help=f"Number of sampled blocks for --estimate (default {DEFAULT_BLOCKS})")
+    p.add_argument("--block-rows", type=int, default=DEFAULT_BLOCK_ROWS, help=f"Rows per sampled block for --estimate (default {DEFAULT_BLOCK_ROWS})")
+    args = p.parse_args()
+    if args.blocks < 1:
+        p.error("--blocks must be at least 1")
+    if args.block_rows < 1:
+        p.error("--block-rows must be at least 1")
+    return args
 
 
 def main():
@@ -62,6 +103,15 @@ def main():
     else:
         encodings = ["utf-8", "cp1252", "latin1"]
 
+    if args.estimate:
+        try:
+            print_estimate(path1, path2, encodings, args.blocks, args.block_rows)
+        except Exception as e:
+            print(f"Failed to estimate differences: {e}")
+            sys.exit(2)
+        if not args.escalate:
+            return
+
     try:
         df1, enc1 = load_csv_with_encodings(path1, encodings)
         print(f"Loaded '{path1}' with encoding: {enc1}")
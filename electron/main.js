@@ -1,10 +1,115 @@
 const { app, BrowserWindow, shell } = require('electron');
 const { spawn } = require('child_process');
+const http = require('http');
 const path = require('path');
 const fs = require('fs');
 
+const STREAMLIT_PORT = 8501;
+const STREAMLIT_URL = `http://localhost:${STREAMLIT_PORT}`;
+const HEALTH_URL = `http://127.0.0.1:${STREAMLIT_PORT}/_stcore/health`;
+const PROBE_INTERVAL_MS = 150;
+const PROBE_TIMEOUT_MS = 30000;
+
 let mainWindow;
 let streamlitProcess;
+let streamlitReady;
+
+function startStreamlit() {
+  // Start Streamlit server
+  const streamlitPath = path.join(__dirname, '..');
+  const pythonCommand = process.platform === 'win32' ? 'python' : 'python3';
+
+  streamlitProcess = spawn(pythonCommand, [
+    '-m', 'streamlit', 'run', 'app.py',
+    '--server.headless', 'true',
+    '--server.port', String(STREAMLIT_PORT),
+    '--server.runOnSave', 'false',
+    '--browser.gatherUsageStats', 'false'
+  ], {
+    cwd: streamlitPath,
+    env: { ...process.env, STREAMLIT_SERVER_PORT: String(STREAMLIT_PORT) }
+  });
+
+  streamlitProcess.stdout.on('data', (data) => {
+    console.log(`Streamlit: ${data}`);
+  });
+
+  streamlitProcess.stderr.on('data', (data) => {
+    console.error(`Streamlit Error: ${data}`);
+  });
+
+  // Without a listener a spawn failure would throw in the main process
+  streamlitProcess.on('error', (err) => {
+    console.error(`Streamlit process error: ${err.message}`);
+  });
+
+  return waitForStreamlit(streamlitProcess);
+}
+
+// Poll Streamlit's health endpoint until the server answers, instead of
+// guessing with a fixed delay. Fails early if the process can't be spawned
+// or exits before it is ready.
+function waitForStreamlit(child) {
+  const deadline = Date.now() + PROBE_TIMEOUT_MS;
+
+  return new Promise((resolve, reject) => {
+    let settled = false;
+
+    const finish = (err) => {
+      if (settled) {
+        return;
+      }
+      settled = true;
+      child.removeListener('error', onError);
+      child.removeListener('exit', onExit);
+      if (err) {
+        reject(err);
+      } else {
+        resolve();
+      }
+    };
+
+    const onError = (err) => {
+      finish(new Error(`Failed to start Streamlit: ${err.message}`));
+    };
+
+    const onExit = (code, signal) => {
+      finish(new Error(`Streamlit exited before it was ready (code ${code}, signal ${signal})`));
+    };
+
+    child.on('error', onError);
+    child.on('exit', onExit);
+
+    const probe = () => {
+      if (settled) {
+        return;
+      }
+      const req = http.get(HEALTH_URL, (res) => {
+        res.resume();
+        if (res.statusCode === 200) {
+          finish();
+        } else {
+          retry();
+        }
+      });
+      req.on('error', retry);
+      req.setTimeout(1000, () => req.destroy());
+    };
+
+    const retry = () => {
+      if (settled) {
+        return;
+      }
+      if (Date.now() > deadline) {
+        finish(new Error('Timed out waiting for Streamlit to start'));
+      } else {
+        setTimeout(probe, PROBE_INTERVAL_MS);
+      }
+    };
+
+    probe();
+  });
+}
 
 function createWindow() {
   mainWindow = new BrowserWindow({
@@ -24,33 +129,25 @@ function createWindow() {
     show: false
   });
 
-  // Start Streamlit server
-  const streamlitPath = path.join(__dirname, '..');
-  const pythonCommand = process.platform === 'win32' ? 'python' : 'python3';
-  
-  streamlitProcess = spawn(pythonCommand, ['-m', 'streamlit', 'run', 'app.py', '--server.headless', 'true'], {
-    cwd: streamlitPath,
-    env: { ...process.env, STREAMLIT_SERVER_PORT: '8501' }
-  });
+  if (!streamlitReady) {
+    streamlitReady = startStreamlit();
+  }
 
-  streamlitProcess.stdout.on('data', (data) => {
-    console.log(`Streamlit: ${data}`);
-  });
+  // Load the app as soon as the pre-warmed server reports healthy
+  streamlitReady
+    .catch((err) => console.error(err.message))
+    .then(() => {
+      if (!mainWindow) {
+        return;
+      }
+      mainWindow.loadURL(STREAMLIT_URL);
+      mainWindow.show();
 
-  streamlitProcess.stderr.on('data', (data) => {
-    console.error(`Streamlit Error: ${data}`);
-  });
-
-  // Wait for Streamlit to be ready, then load the app
-  setTimeout(() => {
-    mainWindow.loadURL('http://localhost:8501');
-    mainWindow.show();
-    
-    // Open DevTools in development
-    if (process.argv.includes('--dev')) {
-      mainWindow.webContents.openDevTools();
-    }
-  }, 3000);
+      // Open DevTools in development
+      if (process.argv.includes('--dev')) {
+        mainWindow.webContents.openDevTools();
+      }
+    });
 
   // Handle window closed
   mainWindow.on('closed', () => {
@@ -65,6 +162,9 @@ function createWindow() {
 }
 
 // App event handlers
+// Pre-warm the server while Electron itself is still initialising
+streamlitReady = startStreamlit();
+
 app.whenReady().then(() => {
   createWindow();
 
@@ -79,6 +179,8 @@ app.on('window-all-closed', () => {
   // Kill Streamlit process
   if (streamlitProcess) {
     streamlitProcess.kill();
+    streamlitProcess = null;
+    streamlitReady = null;
   }
   
   if (process.platform !== 'darwin') {
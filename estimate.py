@@ -0,0 +1,305 @@
+import math
+from io import BytesIO
+from typing import BinaryIO, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from align import align_rows, diff_coordinates, normalize_dataframe_for_comparison, row_hashes
+
+
+DEFAULT_BLOCKS = 20
+DEFAULT_BLOCK_ROWS = 500
+# The File 2 search window grows until it spans this many blocks either side
+MAX_SEARCH_BLOCKS = 32
+Z_95 = 1.96
+
+
+class DivergenceEstimate(NamedTuple):
+    rows_sampled: int
+    blocks: int
+    unaligned_blocks: int  # sampled blocks with no matching rows in File 2, paired by position
+    mismatch_rate: float
+    mismatch_low: float
+    mismatch_high: float
+    column_rates: pd.DataFrame  # index: column; columns: change_rate, low, high
+
+
+def _block_fractions(n_blocks: int) -> np.ndarray:
+    """Evenly spaced relative starting points in [0, 1)."""
+    return np.arange(n_blocks) / n_blocks
+
+
+def _wilson_interval(hits: int, total: int) -> Tuple[float, float]:
+    if total == 0:
+        return 0.0, 1.0
+    p = hits / total
+    denom = 1 + Z_95 ** 2 / total
+    centre = (p + Z_95 ** 2 / (2 * total)) / denom
+    half = Z_95 * math.sqrt(p * (1 - p) / total + Z_95 ** 2 / (4 * total ** 2)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+def _ratio_interval(hits: Sequence[int], totals: Sequence[int]) -> Tuple[float, float, float]:
+    """Ratio estimate with a 95% interval that treats each block as one cluster."""
+    hits_arr = np.asarray(hits, dtype=float)
+    totals_arr = np.asarray(totals, dtype=float)
+    total = totals_arr.sum()
+    if total == 0:
+        return 0.0, 0.0, 1.0
+    rate = float(hits_arr.sum() / total)
+    k = len(totals_arr)
+    if k < 2:
+        low, high = _wilson_interval(int(hits_arr.sum()), int(total))
+        return rate, low, high
+    residuals = hits_arr - rate * totals_arr
+    variance = k / (k - 1) * (residuals ** 2).sum() / total ** 2
+    half = Z_95 * math.sqrt(variance)
+    # Never report tighter bounds than independent row sampling would give
+    wilson_low, wilson_high = _wilson_interval(int(hits_arr.sum()), int(total))
+    return rate, max(0.0, min(rate - half, wilson_low)), min(1.0, max(rate + half, wilson_high))
+
+
+def _read_lines(f: BinaryIO, count: int) -> List[bytes]:
+    lines = []
+    for _ in range(count):
+        line = f.readline()
+        if not line:
+            break
+        lines.append(line)
+    return lines
+
+
+def _read_until(f: BinaryIO, end: int) -> Tuple[List[int], List[bytes]]:
+    """Read whole lines starting before byte ``end``, with their byte offsets."""
+    offsets, lines = [], []
+    while f.tell() < end:
+        pos = f.tell()
+        line = f.readline()
+        if not line:
+            break
+        offsets.append(pos)
+        lines.append(line)
+    return offsets, lines
+
+
+def _block_hashes(block: pd.DataFrame, columns: Sequence) -> np.ndarray:
+    return row_hashes(normalize_dataframe_for_comparison(block[columns].reset_index(drop=True)))
+
+
+def _first_positions(hashes: np.ndarray) -> dict:
+    positions = {}
+    for i, h in enumerate(hashes.tolist()):
+        positions.setdefault(h, i)
+    return positions
+
+
+def _anchor_shift(block_positions: dict, window_hashes: np.ndarray) -> Optional[int]:
+    """Window row matching the block's first row (median over shared rows), or None."""
+    shifts = [j - block_positions[h] for j, h in enumerate(window_hashes.tolist()) if h in block_positions]
+    if not shifts:
+        return None
+    return int(np.median(shifts))
+
+
+def _parse_block(header: bytes, lines: List[bytes], encodings: Sequence[str]) -> pd.DataFrame:
+    last_exc = None
+    for enc in encodings:
+        try:
+            return pd.read_csv(BytesIO(header + b"".join(lines)), encoding=enc)
+        except Exception as e:
+            last_exc = e
+    raise last_exc or Exception("Failed to parse sampled block with any encoding")
+
+
+def read_csv_header(f: BinaryIO, encodings: Sequence[str]) -> pd.Index:
+    """Column names of a seekable CSV byte stream, parsed from its first line only."""
+    f.seek(0)
+    header = f.readline()
+    last_exc = None
+    for enc in encodings:
+        try:
+            return pd.read_csv(BytesIO(header), encoding=enc, nrows=0).columns
+        except Exception as e:
+            last_exc = e
+    raise last_exc or Exception("Failed to parse CSV header with any encoding")
+
+
+def sample_csv_blocks(f1: BinaryIO, f2: BinaryIO, encodings: Sequence[str], columns: Sequence,
+                      n_blocks: int = DEFAULT_BLOCKS,
+                      block_rows: int = DEFAULT_BLOCK_ROWS) -> List[Tuple[pd.DataFrame, pd.DataFrame]]:
+    """Block-sample two seekable CSV byte streams without reading them in full.
+
+    Each block of File 1 starts at an evenly spaced byte offset. Its window in
+    File 2 is found by content: starting at the same relative offset, a search
+    range is widened until rows of the block turn up, and the window is then
+    centred on them with half a block of padding either side. If no row turns
+    up within ``MAX_SEARCH_BLOCKS`` blocks (e.g. every row was modified), the
+    window is the same number of rows at the same relative offset.
+    Quoted fields with embedded newlines are not supported by the line-based seek.
+    """
+    headers = []
+    sizes = []
+    starts = []
+    for f in (f1, f2):
+        f.seek(0)
+        headers.append(f.readline())
+        starts.append(f.tell())
+        f.seek(0, 2)
+        sizes.append(f.tell())
+    body1 = sizes[0] - starts[0]
+    body2 = sizes[1] - starts[1]
+    margin = block_rows // 2
+
+    pairs = []
+    resume = starts[0]
+    for frac in _block_fractions(n_blocks):
+        pos = max(starts[0] + int(frac * body1), resume)
+        if pos >= sizes[0]:
+            break
+        f1.seek(pos)
+        if pos > starts[0] and pos != resume:
+            f1.readline()  # discard the partial line we landed in
+        block_start = f1.tell()
+        lines1 = _read_lines(f1, block_rows)
+        resume = f1.tell()
+        if not lines1:
+            break
+        block1 = _parse_block(headers[0], lines1, encodings)[columns]
+        block_positions = _first_positions(_block_hashes(block1, columns))
+
+        # Search File 2 around the same relative offset, widening until rows match
+        rel = (block_start - starts[0]) / body1 if body1 else 0.0
+        avg_row_bytes = max(1, (resume - block_start) // len(lines1))
+        guess = starts[1] + int(rel * body2)
+        block2 = None
+        radius = max(margin, 1)
+        while radius <= MAX_SEARCH_BLOCKS * block_rows:
+            lo = max(starts[1], guess - radius * avg_row_bytes)
+            hi = guess + (radius + block_rows) * avg_row_bytes
+            f2.seek(lo)
+            if lo > starts[1]:
+                f2.readline()
+            offsets, window = _read_until(f2, hi)
+            if window:
+                window_df = _parse_block(headers[1], window, encodings)[columns]
+                shift = _anchor_shift(block_positions, _block_hashes(window_df, columns))
+                if shift is not None:
+                    first = shift - margin
+                    if first >= 0:
+                        f2.seek(offsets[min(first, len(offsets) - 1)])
+                    else:
+                        # The window starts before the searched range; step back by bytes
+                        back = max(starts[1], offsets[0] + first * avg_row_bytes)
+                        f2.seek(back)
+                        if back > starts[1]:
+                            f2.readline()
+                    lines2 = _read_lines(f2, block_rows + 2 * margin)
+                    block2 = _parse_block(headers[1], lines2, encodings)[columns]
+                    break
+            if lo == starts[1] and hi >= sizes[1]:
+                break  # searched the whole file
+            radius *= 4
+
+        if block2 is None:
+            # Start at the first line beginning at or after the guessed offset
+            f2.seek(max(starts[1], guess - 1))
+            if guess > starts[1]:
+                f2.readline()
+            block2 = _parse_block(headers[1], _read_lines(f2, len(lines1)), encodings)[columns]
+        pairs.append((block1, block2))
+    return pairs
+
+
+def sample_frame_blocks(df1: pd.DataFrame, df2: pd.DataFrame, columns: Sequence,
+                        n_blocks: int = DEFAULT_BLOCKS,
+                        block_rows: int = DEFAULT_BLOCK_ROWS) -> List[Tuple[pd.DataFrame, pd.DataFrame]]:
+    """Block-sample two already loaded DataFrames (e.g. Excel sheets) by row position.
+
+    File 2 windows are located by content the same way as ``sample_csv_blocks``.
+    """
+    margin = block_rows // 2
+    pairs = []
+    resume = 0
+    for frac in _block_fractions(n_blocks):
+        start = max(int(frac * len(df1)), resume)
+        if start >= len(df1):
+            break
+        block1 = df1[columns].iloc[start:start + block_rows]
+        resume = start + len(block1)
+        block_positions = _first_positions(_block_hashes(block1, columns))
+
+        guess = int(start / len(df1) * len(df2))
+        block2 = None
+        radius = max(margin, 1)
+        while radius <= MAX_SEARCH_BLOCKS * block_rows:
+            lo = max(0, guess - radius)
+            hi = min(len(df2), guess + radius + block_rows)
+            shift = _anchor_shift(block_positions, _block_hashes(df2.iloc[lo:hi], columns))
+            if shift is not None:
+                start2 = max(0, lo + shift - margin)
+                block2 = df2[columns].iloc[start2:start2 + block_rows + 2 * margin]
+                break
+            if lo == 0 and hi == len(df2):
+                break  # searched the whole frame
+            radius *= 4
+
+        if block2 is None:
+            block2 = df2[columns].iloc[guess:guess + len(block1)]
+        pairs.append((block1, block2))
+    return pairs
+
+
+def estimate_divergence(blocks: List[Tuple[pd.DataFrame, pd.DataFrame]],
+                        columns: Optional[Sequence] = None) -> DivergenceEstimate:
+    """Estimate the share of File 1 rows that differ in File 2 from sampled block pairs.
+
+    Rows inside each block pair are aligned with the same engine as the full
+    compare; a File 1 row counts as mismatched if it is modified or missing.
+    Per-column rates are the share of aligned rows whose value in that column
+    changed. Block pairs sharing no row at all are paired by position, as the
+    full compare does for unmatched rows, and reported as unaligned.
+    """
+    if columns is None:
+        columns = blocks[0][0].columns if blocks else []
+    columns = list(columns)
+    if not columns:
+        raise ValueError("No common columns between the files")
+
+    row_hits, row_totals = [], []
+    col_hits = {col: [] for col in columns}
+    col_totals = []
+    unaligned = 0
+    for block1, block2 in blocks:
+        norm1 = normalize_dataframe_for_comparison(block1[columns].reset_index(drop=True))
+        norm2 = normalize_dataframe_for_comparison(block2[columns].reset_index(drop=True))
+        hashes1, hashes2 = row_hashes(norm1), row_hashes(norm2)
+        if np.isin(hashes1, hashes2).any():
+            alignment = align_rows(hashes1, hashes2)
+        else:
+            # Nothing to anchor on; skip the Myers search, which can only pair by position
+            unaligned += 1
+            alignment = align_rows(hashes1, hashes2, max_edits=0)
+
+        diffs = diff_coordinates(alignment, norm1, norm2, norm1, norm2)
+        row_hits.append(diffs["row"].nunique() + len(alignment.deleted))
+        row_totals.append(len(norm1))
+        col_totals.append(len(alignment.left))
+
+        diff_counts = diffs["column"].value_counts()
+        for col in columns:
+            col_hits[col].append(int(diff_counts.get(col, 0)))
+
+    rate, low, high = _ratio_interval(row_hits, row_totals)
+    column_rows = {col: _ratio_interval(col_hits[col], col_totals) for col in columns}
+    column_rates = pd.DataFrame.from_dict(column_rows, orient="index",
+                                          columns=["change_rate", "low", "high"])
+    return DivergenceEstimate(
+        rows_sampled=int(sum(row_totals)),
+        blocks=len(blocks),
+        unaligned_blocks=unaligned,
+        mismatch_rate=rate,
+        mismatch_low=low,
+        mismatch_high=high,
+        column_rates=column_rates,
+    )
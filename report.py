@@ -0,0 +1,69 @@
+from io import BytesIO
+
+import pandas as pd
+
+
+def compact_report(diffs, columns):
+    """Wide per-row report (column -> self/other) built from the sparse diff list."""
+    if diffs.empty:
+        return pd.DataFrame()
+    wide = diffs.pivot(index=["row1", "row2"], columns="column", values=["file1", "file2"])
+    wide = wide.swaplevel(axis=1).rename(columns={"file1": "self", "file2": "other"}, level=1)
+    changed_cols = [col for col in columns if col in set(diffs["column"])]
+    wide = wide.reindex(columns=pd.MultiIndex.from_product([changed_cols, ["self", "other"]]))
+    wide.index.names = ["row_file1", "row_file2"]
+    return wide
+
+
+def side_by_side(df1_rows, df2_rows, columns, alignment):
+    """Interleave '<col>_file1'/'<col>_file2' values of aligned pairs, led by each file's row number."""
+    parts = [
+        pd.Series(alignment.left[df1_rows.index], index=df1_rows.index, name="row_file1"),
+        pd.Series(alignment.right[df2_rows.index], index=df2_rows.index, name="row_file2"),
+    ]
+    for col in columns:
+        parts.append(df1_rows[col].rename(f"{col}_file1"))
+        parts.append(df2_rows[col].rename(f"{col}_file2"))
+    return pd.concat(parts, axis=1)
+
+
+def diff_styles(display, diffs, row_col):
+    """Cell styles for a displayed frame, marking only the cells in the diff list.
+
+    ``row_col`` names the diff-list column ("row1" or "row2") holding the
+    row numbers the frame is labelled with.
+    """
+    styles = pd.DataFrame("", index=display.index, columns=display.columns).to_numpy()
+    in_view = diffs[diffs[row_col].isin(display.index)]
+    rows = display.index.get_indexer(in_view[row_col])
+    cols = display.columns.get_indexer(in_view["column"])
+    styles[rows, cols] = "background-color: #ffcccc"
+    return pd.DataFrame(styles, index=display.index, columns=display.columns)
+
+
+def highlight_excel_diffs(excel_bytes, sheet_name, diffs, row_labels, columns, first_col):
+    """Fill the differing cell pairs of a side-by-side sheet in red.
+
+    Only cells listed in ``diffs`` are touched; ``first_col`` is the 1-based
+    sheet column holding the first ``<col>_file1`` value.
+    """
+    import openpyxl
+    from openpyxl.styles import PatternFill
+
+    wb = openpyxl.load_workbook(excel_bytes)
+    if sheet_name in wb.sheetnames:
+        ws = wb[sheet_name]
+        red = PatternFill(start_color="FFFFC7CE", end_color="FFFFC7CE", fill_type="solid")
+        rows = row_labels.get_indexer(diffs["row"])
+        cols = columns.get_indexer(diffs["column"])
+        for r, c in zip(rows, cols):
+            if r < 0:
+                continue
+            # +2: openpyxl rows are 1-based and the first row is the header
+            ws.cell(row=r + 2, column=first_col + 2 * c).fill = red
+            ws.cell(row=r + 2, column=first_col + 2 * c + 1).fill = red
+
+    out = BytesIO()
+    wb.save(out)
+    out.seek(0)
+    return out.getvalue()
@@ -0,0 +1,117 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from align import align_rows, diff_coordinates, normalize_dataframe_for_comparison, row_hashes
+
+
+def _hashes(values):
+    return np.asarray(values, dtype=np.uint64)
+
+
+def _pairs(alignment):
+    return list(zip(alignment.left.tolist(), alignment.right.tolist()))
+
+
+def test_text_numbers_hash_like_numeric_column():
+    # File 1 holds a float column; File 2 has the same values as text plus one
+    # non-numeric cell (so it stays object dtype) and a row inserted at 10.
+    values = np.arange(1000, dtype=float)
+    df1 = pd.DataFrame({"x": values, "y": [f"r{i}" for i in range(1000)]})
+    df2 = df1.copy()
+    df2["x"] = [str(int(v)) for v in values]
+    df2.loc[500, "x"] = "n/a"
+    extra = pd.DataFrame({"x": ["77777"], "y": ["new"]})
+    df2 = pd.concat([df2.iloc[:10], extra, df2.iloc[10:]]).reset_index(drop=True)
+
+    alignment = align_rows(row_hashes(normalize_dataframe_for_comparison(df1)),
+                           row_hashes(normalize_dataframe_for_comparison(df2)))
+
+    assert alignment.inserted.tolist() == [10]
+    assert alignment.deleted.tolist() == []
+    assert len(alignment.left) == 1000
+    assert alignment.left[alignment.changed].tolist() == [500]
+
+
+@pytest.mark.parametrize("at", [0, 5, 10])
+def test_single_inserted_row(at):
+    rows = list(range(1, 11))
+    alignment = align_rows(_hashes(rows), _hashes(rows[:at] + [99] + rows[at:]))
+
+    assert alignment.inserted.tolist() == [at]
+    assert alignment.deleted.tolist() == []
+    assert _pairs(alignment) == [(i, i + (i >= at)) for i in range(10)]
+    assert not alignment.changed.any()
+
+
+def test_deleted_row():
+    rows = list(range(1, 11))
+    alignment = align_rows(_hashes(rows), _hashes(rows[:4] + rows[5:]))
+
+    assert alignment.deleted.tolist() == [4]
+    assert alignment.inserted.tolist() == []
+    assert alignment.left.tolist() == [0, 1, 2, 3, 5, 6, 7, 8, 9]
+    assert alignment.right.tolist() == list(range(9))
+
+
+def test_modified_row_next_to_leading_insert():
+    # File 2 gains a row at the top and its next row is modified: the
+    # modified row pairs with row 0 of file 1 and the new row is inserted
+    alignment = align_rows(_hashes([1, 2, 3, 4]), _hashes([99, 11, 2, 3, 4]))
+
+    assert alignment.inserted.tolist() == [0]
+    assert alignment.deleted.tolist() == []
+    assert _pairs(alignment) == [(0, 1), (1, 2), (2, 3), (3, 4)]
+    assert alignment.changed.tolist() == [True, False, False, False]
+
+
+def test_modified_row_next_to_insert_in_middle():
+    alignment = align_rows(_hashes([1, 2, 3, 4]), _hashes([1, 22, 99, 3, 4]))
+
+    assert alignment.inserted.tolist() == [2]
+    assert _pairs(alignment) == [(0, 0), (1, 1), (2, 3), (3, 4)]
+    assert alignment.changed.tolist() == [False, True, False, False]
+
+
+def test_myers_cutoff_falls_back_to_positional_pairing():
+    # No row is unique on either side, so only Myers can match these
+    a = _hashes([1, 2, 1, 2, 1, 2])
+    b = _hashes([2, 1, 2, 1, 2, 1])
+
+    exact = align_rows(a, b)
+    assert exact.deleted.tolist() == [0]
+    assert exact.inserted.tolist() == [5]
+    assert not exact.changed.any()
+
+    cut = align_rows(a, b, max_edits=1)
+    assert _pairs(cut) == [(i, i) for i in range(6)]
+    assert cut.deleted.tolist() == []
+    assert cut.inserted.tolist() == []
+    assert cut.changed.all()
+
+
+def test_diff_coordinates_values():
+    df1 = pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"], "qty": ["10", "20", "30"]})
+    df2 = pd.DataFrame({"id": [0, 1, 2, 3], "name": ["new", "a", "B", "c"], "qty": [5, 10.0, 21, 30]})
+    norm1 = normalize_dataframe_for_comparison(df1)
+    norm2 = normalize_dataframe_for_comparison(df2)
+    alignment = align_rows(row_hashes(norm1), row_hashes(norm2))
+
+    diffs = diff_coordinates(alignment, norm1, norm2, df1, df2)
+
+    assert alignment.inserted.tolist() == [0]
+    assert diffs.to_dict("records") == [
+        {"row": 1, "row1": 1, "row2": 2, "column": "name", "file1": "b", "file2": "B"},
+        {"row": 1, "row1": 1, "row2": 2, "column": "qty", "file1": "20", "file2": 21},
+    ]
+
+
+def test_diff_coordinates_without_changes_is_empty():
+    df = pd.DataFrame({"x": [1, 2]})
+    norm = normalize_dataframe_for_comparison(df)
+    alignment = align_rows(row_hashes(norm), row_hashes(norm))
+
+    diffs = diff_coordinates(alignment, norm, norm, df, df)
+
+    assert diffs.empty
+    assert list(diffs.columns) == ["row", "row1", "row2", "column", "file1", "file2"]
@@ -0,0 +1,74 @@
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from estimate import estimate_divergence, sample_csv_blocks, sample_frame_blocks
+
+
+def _drifted_files():
+    # Deleting 1800 rows near the top (between the first two sampled blocks)
+    # shifts every later row far beyond the half-block padding of each window.
+    n = 50000
+    df1 = pd.DataFrame({"id": range(n), "qty": np.random.default_rng(0).integers(0, 100, n)})
+    df2 = df1.drop(range(600, 2400)).reset_index(drop=True)
+    return df1, df2
+
+
+def test_csv_windows_follow_row_drift():
+    df1, df2 = _drifted_files()
+    f1 = BytesIO(df1.to_csv(index=False).encode())
+    f2 = BytesIO(df2.to_csv(index=False).encode())
+
+    est = estimate_divergence(sample_csv_blocks(f1, f2, ["utf-8"], df1.columns), df1.columns)
+
+    assert est.unaligned_blocks == 0
+    assert est.mismatch_rate < 0.01
+
+
+def test_frame_windows_follow_row_drift():
+    df1, df2 = _drifted_files()
+
+    est = estimate_divergence(sample_frame_blocks(df1, df2, df1.columns), df1.columns)
+
+    assert est.unaligned_blocks == 0
+    assert est.mismatch_rate < 0.01
+
+
+def _clustered_changes(changed_from):
+    # Every row from `changed_from` on gets a new timestamp of the same width,
+    # so whole sampled blocks have no row in common with File 2
+    n = 20000
+    df1 = pd.DataFrame({"id": range(n), "qty": np.random.default_rng(1).integers(0, 100, n),
+                        "ts": "2024-01-01"})
+    df2 = df1.copy()
+    df2.loc[changed_from:, "ts"] = "2025-06-30"
+    return df1, df2
+
+
+@pytest.mark.parametrize("changed_from, expected", [(10000, 0.5), (0, 1.0)])
+def test_csv_blocks_with_every_row_modified_are_counted(changed_from, expected):
+    df1, df2 = _clustered_changes(changed_from)
+    f1 = BytesIO(df1.to_csv(index=False).encode())
+    f2 = BytesIO(df2.to_csv(index=False).encode())
+
+    est = estimate_divergence(sample_csv_blocks(f1, f2, ["utf-8"], df1.columns), df1.columns)
+
+    assert est.unaligned_blocks == round(20 * expected)
+    assert est.mismatch_rate == pytest.approx(expected, abs=0.01)
+    assert est.column_rates.loc["ts", "change_rate"] == pytest.approx(expected, abs=0.01)
+    assert est.column_rates.loc["id", "change_rate"] == 0
+    assert est.column_rates.loc["qty", "change_rate"] == 0
+
+
+@pytest.mark.parametrize("changed_from, expected", [(10000, 0.5), (0, 1.0)])
+def test_frame_blocks_with_every_row_modified_are_counted(changed_from, expected):
+    df1, df2 = _clustered_changes(changed_from)
+
+    est = estimate_divergence(sample_frame_blocks(df1, df2, df1.columns), df1.columns)
+
+    assert est.unaligned_blocks == round(20 * expected)
+    assert est.mismatch_rate == pytest.approx(expected, abs=0.01)
+    assert est.column_rates.loc["ts", "change_rate"] == pytest.approx(expected, abs=0.01)
+    assert est.column_rates.loc["id", "change_rate"] == 0
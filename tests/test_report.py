@@ -0,0 +1,100 @@
+from io import BytesIO
+
+import openpyxl
+import pandas as pd
+
+from align import align_rows, diff_coordinates, normalize_dataframe_for_comparison, row_hashes
+from report import compact_report, diff_styles, highlight_excel_diffs, side_by_side
+
+
+def _compared():
+    # File 2 gains a row at the top; file 1 rows 9 and 19 are then modified
+    # in "alpha" and "zeta" respectively (file 2 rows 10 and 20)
+    df1 = pd.DataFrame({"id": range(20), "zeta": [f"z{i}" for i in range(20)],
+                        "alpha": [i * 10 for i in range(20)]})
+    df2 = pd.concat([pd.DataFrame({"id": [-1], "zeta": ["new"], "alpha": [0]}), df1]).reset_index(drop=True)
+    df2.loc[10, "alpha"] = 999
+    df2.loc[20, "zeta"] = "changed"
+    norm1 = normalize_dataframe_for_comparison(df1)
+    norm2 = normalize_dataframe_for_comparison(df2)
+    alignment = align_rows(row_hashes(norm1), row_hashes(norm2))
+    diffs = diff_coordinates(alignment, norm1, norm2, df1, df2)
+    df1_aligned = df1.iloc[alignment.left].reset_index(drop=True)
+    df2_aligned = df2.iloc[alignment.right].reset_index(drop=True)
+    return df1_aligned, df2_aligned, alignment, diffs
+
+
+def _filled_cells(excel_bytes):
+    ws = openpyxl.load_workbook(BytesIO(excel_bytes))["side_by_side"]
+    return sorted(cell.coordinate for row in ws.iter_rows() for cell in row
+                  if cell.fill.fill_type == "solid")
+
+
+def _highlighted(frame, diffs, columns):
+    out = BytesIO()
+    with pd.ExcelWriter(out, engine="openpyxl") as writer:
+        frame.to_excel(writer, index=False, sheet_name="side_by_side")
+    out.seek(0)
+    return highlight_excel_diffs(out, "side_by_side", diffs, frame.index, columns, first_col=3)
+
+
+def test_compact_report_pivots_in_file_column_order():
+    df1_aligned, _, _, diffs = _compared()
+
+    report = compact_report(diffs, df1_aligned.columns)
+
+    assert report.columns.tolist() == [("zeta", "self"), ("zeta", "other"),
+                                       ("alpha", "self"), ("alpha", "other")]
+    assert report.index.names == ["row_file1", "row_file2"]
+    assert report.index.tolist() == [(9, 10), (19, 20)]
+    assert report.loc[(9, 10), ("alpha", "self")] == 90
+    assert report.loc[(9, 10), ("alpha", "other")] == 999
+    assert pd.isna(report.loc[(9, 10), ("zeta", "self")])
+    assert report.loc[(19, 20), ("zeta", "other")] == "changed"
+
+
+def test_compact_report_without_diffs_is_empty():
+    _, _, _, diffs = _compared()
+
+    assert compact_report(diffs.iloc[:0], ["id", "zeta", "alpha"]).empty
+
+
+def test_diff_styles_marks_only_listed_cells():
+    _, df2_aligned, alignment, diffs = _compared()
+    display = df2_aligned.set_axis(alignment.right[df2_aligned.index])
+
+    styles = diff_styles(display, diffs, "row2")
+
+    marked = [(row, col) for row in styles.index for col in styles.columns if styles.loc[row, col]]
+    assert marked == [(10, "alpha"), (20, "zeta")]
+    assert styles.loc[10, "alpha"] == "background-color: #ffcccc"
+
+
+def test_side_by_side_interleaves_file_columns():
+    df1_aligned, df2_aligned, alignment, _ = _compared()
+
+    combined = side_by_side(df1_aligned, df2_aligned, df1_aligned.columns, alignment)
+
+    assert combined.columns.tolist() == ["row_file1", "row_file2", "id_file1", "id_file2",
+                                         "zeta_file1", "zeta_file2", "alpha_file1", "alpha_file2"]
+    assert combined.loc[0, ["row_file1", "row_file2"]].tolist() == [0, 1]
+
+
+def test_excel_fills_follow_aligned_rows_after_insert():
+    df1_aligned, df2_aligned, alignment, diffs = _compared()
+    combined = side_by_side(df1_aligned, df2_aligned, df1_aligned.columns, alignment)
+
+    filled = _filled_cells(_highlighted(combined, diffs, df1_aligned.columns))
+
+    # Pair 9 sits on sheet row 11 and pair 19 on row 21; id is C/D, zeta E/F, alpha G/H
+    assert filled == ["E21", "F21", "G11", "H11"]
+
+
+def test_excel_fills_only_differing_rows_view():
+    df1_aligned, df2_aligned, alignment, diffs = _compared()
+    mask = df1_aligned.index.isin(diffs["row"])
+    combined = side_by_side(df1_aligned[mask], df2_aligned[mask], df1_aligned.columns, alignment)
+
+    filled = _filled_cells(_highlighted(combined, diffs, df1_aligned.columns))
+
+    assert filled == ["E3", "F3", "G2", "H2"]